@@ -1,29 +1,36 @@
 """"Account deposit module"""
-from datetime import datetime, timezone
-import hashlib
+import time
+from hashlib import sha256 as _sha256
 
 class AccountDeposit:
     """
     Class representing a deposit into an account.
     Generates a secure deposit signature and provides serialization.
     """
+    __ALGORITHM = "SHA-256"
+    __TRANSACTION_TYPE = "DEPOSIT"
+    __SIGNATURE_PREFIX = f"{{alg:{__ALGORITHM},typ:{__TRANSACTION_TYPE},"
+    __JSON_TEMPLATE = {"alg": __ALGORITHM, "type": __TRANSACTION_TYPE, "to_iban": None,
+                       "deposit_amount": None, "deposit_date": None, "deposit_signature": None}
+    __slots__ = ("__to_iban", "__deposit_amount", "__deposit_date", "__deposit_signature")
+
     def __init__(self, to_iban: str, deposit_amount: float):
         """Initialize the deposit with IBAN, amount, and timestamp."""
-        self.__algorithm = "SHA-256"
-        self.__transaction_type = "DEPOSIT"
         self.__to_iban = to_iban
         self.__deposit_amount = deposit_amount
-        self.__deposit_date = datetime.timestamp(datetime.now(timezone.utc))
+        self.__deposit_date = time.time()
+        self.__deposit_signature = _sha256(
+            self.__compose_signature_string().encode("ascii")).hexdigest()
 
     @property
     def algorithm(self) -> str:
         """Returns the algorithm used for signature generation."""
-        return self.__algorithm
+        return self.__ALGORITHM
 
     @property
     def transaction_type(self) -> str:
         """Returns the type of transaction."""
-        return self.__transaction_type
+        return self.__TRANSACTION_TYPE
 
     @property
     def to_iban(self) -> str:
@@ -42,7 +49,7 @@ class AccountDeposit:
 
     def __compose_signature_string(self) -> str:
         return (
-            f"{{alg:{self.__algorithm},typ:{self.__transaction_type},"
+            f"{self.__SIGNATURE_PREFIX}"
             f"iban:{self.__to_iban},amount:{self.__deposit_amount},"
             f"deposit_date:{self.__deposit_date}}}"
         )
@@ -50,15 +57,13 @@ class AccountDeposit:
     @property
     def deposit_signature(self) -> str:
         """SHA-256 hash uniquely identifying this deposit"""
-        return hashlib.sha256(self.__compose_signature_string().encode()).hexdigest()
+        return self.__deposit_signature
 
     def to_json(self) -> dict:
         """Returns a JSON-serializable dictionary of the deposit"""
-        return {
-            "alg": self.algorithm,
-            "type": self.transaction_type,
-            "to_iban": self.__to_iban,
-            "deposit_amount": self.__deposit_amount,
-            "deposit_date": self.__deposit_date,
-            "deposit_signature": self.deposit_signature
-        }
+        deposit_json = self.__JSON_TEMPLATE.copy()
+        deposit_json["to_iban"] = self.__to_iban
+        deposit_json["deposit_amount"] = self.__deposit_amount
+        deposit_json["deposit_date"] = self.__deposit_date
+        deposit_json["deposit_signature"] = self.__deposit_signature
+        return deposit_json
@@ -1,7 +1,5 @@
 """Account manager module """
-import os.path
-import re
-from datetime import datetime, timezone
+import time
 from uc3m_money.account_management_exception import AccountManagementException
 from uc3m_money.account_management_config import (
     TRANSACTIONS_STORE_FILE,
@@ -11,7 +9,14 @@ from uc3m_money.account_management_config import (
 from uc3m_money.singleton_meta import SingletonMeta
 from uc3m_money.transfer_manager import TransferManager
 from uc3m_money.account_deposit import AccountDeposit
-from uc3m_money.utils import load_json_or_empty, append_record, validate_iban, load_json_strict
+from uc3m_money.utils import (load_json_or_empty, append_record, validate_iban,
+                              load_json_strict, file_signature)
+
+
+def _is_valid_amount(amount: str) -> bool:
+    """Check an amount has the exact shape 'EUR dddd.dd' (ASCII digits)."""
+    return (len(amount) == 11 and amount.startswith("EUR ") and amount[8] == "." and
+            amount.isascii() and amount[4:8].isdigit() and amount[9:].isdigit())
 
 
 class DepositService(metaclass=SingletonMeta):
@@ -32,7 +37,7 @@ class DepositService(metaclass=SingletonMeta):
             raise AccountManagementException("Error - Invalid Key in JSON") from e
 
         deposit_iban = validate_iban(deposit_iban)
-        if not re.fullmatch(r"^EUR [0-9]{4}\.[0-9]{2}", deposit_amount):
+        if not _is_valid_amount(deposit_amount):
             raise AccountManagementException("Error - Invalid deposit amount")
 
         deposit_amount_float = float(deposit_amount[4:])
@@ -53,39 +58,55 @@ class DepositService(metaclass=SingletonMeta):
 
 class BalanceService(metaclass=SingletonMeta):
     """Handles balance calculation and persistence."""
+    def __init__(self):
+        self._transactions_signature = None
+        self._balance_index = {}
+
     def calculate_and_save_balance(self, iban: str) -> bool:
         """Calculate and save balance for a given IBAN."""
         validated_iban = validate_iban(iban)
-        transactions = self._load_transactions()
-        balance = self._calculate_balance(validated_iban, transactions)
+        balance_index = self._load_balance_index()
+        balance = self._calculate_balance(validated_iban, balance_index)
         self._save_balance(validated_iban, balance)
         return True
 
-    def _load_transactions(self) -> list:
-        """Load transactions from file."""
-        if not os.path.isfile(TRANSACTIONS_STORE_FILE):
+    def _load_balance_index(self) -> dict:
+        """Return transaction amounts per IBAN, re-reading the file only if it changed."""
+        signature = file_signature(TRANSACTIONS_STORE_FILE)
+        if signature is None:
             raise AccountManagementException("Wrong file  or file path")
-        return load_json_or_empty(TRANSACTIONS_STORE_FILE)
-
-    def _calculate_balance(self, iban: str, transactions: list) -> float:
-        """Calculate balance for given IBAN from transactions."""
-        iban_found = False
-        balance = 0.0
+        if signature != self._transactions_signature:
+            transactions = load_json_or_empty(TRANSACTIONS_STORE_FILE)
+            self._balance_index = self._build_balance_index(transactions)
+            self._transactions_signature = signature
+        return self._balance_index
+
+    def _build_balance_index(self, transactions: list) -> dict:
+        """Group transaction amounts by IBAN, keeping file order."""
+        balance_index = {}
         for transaction in transactions:
-            if transaction.get("IBAN") == iban:
-                balance += float(transaction.get("amount", 0))
-                iban_found = True
-
-        if not iban_found:
+            iban = transaction.get("IBAN")
+            # only string IBANs can match a validated one; others may be unhashable
+            if isinstance(iban, str):
+                balance_index.setdefault(iban, []).append(transaction.get("amount", 0))
+        return balance_index
+
+    def _calculate_balance(self, iban: str, balance_index: dict) -> float:
+        """Calculate balance for given IBAN from the indexed amounts."""
+        amounts = balance_index.get(iban)
+        if amounts is None:
             raise AccountManagementException("IBAN not found")
 
+        balance = 0.0
+        for amount in amounts:
+            balance += float(amount)
         return balance
 
     def _save_balance(self, iban: str, balance: float) -> None:
         """Save balance record to the balances file."""
         balance_record = {
             "IBAN": iban,
-            "time": datetime.timestamp(datetime.now(timezone.utc)),
+            "time": time.time(),
             "BALANCE": balance
         }
         append_record(BALANCES_STORE_FILE, balance_record)
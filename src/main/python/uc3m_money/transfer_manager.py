@@ -1,28 +1,36 @@
 """Transfer manager module"""
 import re
-from datetime import datetime, timezone
+from datetime import date as _date, datetime, timezone
+from hashlib import blake2b
 from uc3m_money.account_management_exception import AccountManagementException
 from uc3m_money.account_management_config import TRANSFERS_STORE_FILE
 from uc3m_money.transfer_request import TransferRequest
 from uc3m_money.singleton_meta import SingletonMeta
-from uc3m_money.utils import append_record, validate_iban, load_json_or_empty
+from uc3m_money.utils import (append_record, validate_iban, load_json_or_empty,
+                              file_signature)
+
+_CONCEPT_RE = re.compile(r"(?=^.{10,30}$)([a-zA-Z]+(\s[a-zA-Z]+)+)")
+_DATE_RE = re.compile(r"(([0-2]\d|3[0-1])\/(0\d|1[0-2])\/\d\d\d\d)")
+_TRANSFER_TYPES = ("ORDINARY", "INMEDIATE", "URGENT")
+
 
 class TransferManager(metaclass=SingletonMeta):
     """Class for managing transfer operations"""
+    def __init__(self):
+        self._transfers_signature = None
+        self._transfer_keys = set()
 
     def validate_concept(self, concept: str):
         """Validates the concept string for correct format and length."""
-        pattern = r"^(?=^.{10,30}$)([a-zA-Z]+(\s[a-zA-Z]+)+)$"
-        if not re.fullmatch(pattern, concept):
+        if not _CONCEPT_RE.fullmatch(concept):
             raise AccountManagementException("Invalid concept format")
 
     def validate_transfer_date(self, date_str):
         """Validates that the transfer date has a correct format and is not in the past"""
-        date_pattern = re.compile(r"^(([0-2]\d|3[0-1])\/(0\d|1[0-2])\/\d\d\d\d)$")
-        if not date_pattern.fullmatch(date_str):
+        if not _DATE_RE.fullmatch(date_str):
             raise AccountManagementException("Invalid date format")
         try:
-            transfer_date = datetime.strptime(date_str, "%d/%m/%Y").date()
+            transfer_date = _date(int(date_str[6:]), int(date_str[3:5]), int(date_str[:2]))
         except ValueError as ex:
             raise AccountManagementException("Invalid date format") from ex
         if transfer_date < datetime.now(timezone.utc).date():
@@ -36,7 +44,7 @@ class TransferManager(metaclass=SingletonMeta):
             amount = float(amount)
         except ValueError as exc:
             raise AccountManagementException("Invalid transfer amount") from exc
-        if '.' in str(amount) and len(str(amount).split('.')[1]) > 2:
+        if len(str(amount).partition(".")[2]) > 2:
             raise AccountManagementException("Invalid transfer amount")
         if amount < 10 or amount > 10000:
             raise AccountManagementException("Invalid transfer amount")
@@ -46,28 +54,56 @@ class TransferManager(metaclass=SingletonMeta):
                                    date: str, amount: float) -> float:
         """Validates transfer concept, type, date, and amount."""
         self.validate_concept(concept)
-        if not re.fullmatch(r"(ORDINARY|INMEDIATE|URGENT)",
-                           transfer_type):
+        if transfer_type not in _TRANSFER_TYPES:
             raise AccountManagementException("Invalid transfer type")
         self.validate_transfer_date(date)
         validated_amount = self._validate_transfer_amount(amount)
         return validated_amount
 
-    def is_duplicate_transfer(self, transfer_list: list, request: TransferRequest) -> bool:
-        """Check if the transfer is already in the list."""
-        for existing in transfer_list:
-            if self._is_matching_transfer(existing, request):
-                return True
-        return False
-
-    def _is_matching_transfer(self, existing: dict, request: TransferRequest) -> bool:
-        """Compare transfer details to check for duplicates."""
-        return (existing["from_iban"] == request.from_iban and
-                existing["to_iban"] == request.to_iban and
-                existing["transfer_date"] == request.transfer_date and
-                existing["transfer_amount"] == request.transfer_amount and
-                existing["transfer_concept"] == request.transfer_concept and
-                existing["transfer_type"] == request.transfer_type)
+    def _load_transfer_keys(self) -> set:
+        """Return keys of the stored transfers, re-reading the store only if it changed."""
+        signature = file_signature(TRANSFERS_STORE_FILE)
+        if signature != self._transfers_signature:
+            transfer_keys = set()
+            for existing in load_json_or_empty(TRANSFERS_STORE_FILE):
+                try:
+                    transfer_keys.add(self._stored_transfer_key(existing))
+                except (KeyError, TypeError, ValueError, OverflowError):
+                    # a malformed record cannot equal any validated request
+                    continue
+            self._transfer_keys = transfer_keys
+            self._transfers_signature = signature
+        return self._transfer_keys
+
+    def _stored_transfer_key(self, existing: dict) -> bytes:
+        """Key identifying a stored transfer."""
+        return self._transfer_key((existing["from_iban"], existing["to_iban"],
+                                   existing["transfer_date"], existing["transfer_amount"],
+                                   existing["transfer_concept"], existing["transfer_type"]))
+
+    def _request_transfer_key(self, request: TransferRequest) -> bytes:
+        """Key identifying a transfer request."""
+        return self._transfer_key((request.from_iban, request.to_iban, request.transfer_date,
+                                   request.transfer_amount, request.transfer_concept,
+                                   request.transfer_type))
+
+    def _transfer_key(self, details: tuple) -> bytes:
+        """Fixed-size digest of the transfer details compared for duplicates.
+
+        Two transfers get the same key exactly when all their details compare
+        equal. Raises TypeError or ValueError for details no request can have.
+        """
+        from_iban, to_iban, transfer_date, amount, concept, transfer_type = details
+        fields = [from_iban, to_iban, transfer_date, concept, transfer_type]
+        if not all(isinstance(field, str) for field in fields):
+            raise TypeError("transfer details must be strings")
+        # requests carry float amounts, so only numbers equal to a float can match
+        if not isinstance(amount, (int, float)) or float(amount) != amount:
+            raise ValueError("transfer amount must equal a float")
+        fields.append(repr(float(amount)))
+        # length-prefixed fields keep the encoding unambiguous for any concept
+        text = "".join(f"{len(field)}:{field}" for field in fields)
+        return blake2b(text.encode("utf-8"), digest_size=16).digest()
 
     def create_transfer(self, from_iban: str,
                        to_iban: str,
@@ -89,9 +125,12 @@ class TransferManager(metaclass=SingletonMeta):
             transfer_amount=validated_amount
         )
 
-        transfer_list = load_json_or_empty(TRANSFERS_STORE_FILE)
-        if self.is_duplicate_transfer(transfer_list, transfer):
+        transfer_keys = self._load_transfer_keys()
+        transfer_key = self._request_transfer_key(transfer)
+        if transfer_key in transfer_keys:
             raise AccountManagementException("Duplicated transfer in transfer list")
         append_record(TRANSFERS_STORE_FILE, transfer.to_json())
+        transfer_keys.add(transfer_key)
+        self._transfers_signature = file_signature(TRANSFERS_STORE_FILE)
 
         return transfer.transfer_code
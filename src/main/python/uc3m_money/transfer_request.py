@@ -1,13 +1,17 @@
 """Transfer request module"""
 import hashlib
 import json
-from datetime import datetime, timezone
+import time
 
-class TransferRequest:
+# the eighth slot only memoizes transfer_code; the request itself has seven fields
+class TransferRequest:  # pylint: disable=too-many-instance-attributes
     """
     Represents a request to transfer money between two IBAN accounts.
     Stores key transfer details, timestamp, and supports serialization.
     """
+    __slots__ = ("__from_iban", "__to_iban", "__transfer_type", "__concept",
+                 "__transfer_date", "__transfer_amount", "__time_stamp", "__transfer_code")
+
     def __init__(self, from_iban: str, transfer_type: str, to_iban: str,
                  transfer_concept: str, transfer_date: str, transfer_amount: float):
         self.__from_iban = from_iban
@@ -16,11 +20,20 @@ class TransferRequest:
         self.__concept = transfer_concept
         self.__transfer_date = transfer_date
         self.__transfer_amount = transfer_amount
-        justnow = datetime.now(timezone.utc)
-        self.__time_stamp = datetime.timestamp(justnow)
+        self.__time_stamp = time.time()
+        self.__transfer_code = None
 
     def __str__(self) -> str:
-        return "Transfer:" + json.dumps(self.__dict__)
+        # keys are the original attribute names so transfer codes stay stable
+        return "Transfer:" + json.dumps({
+            "_TransferRequest__from_iban": self.__from_iban,
+            "_TransferRequest__to_iban": self.__to_iban,
+            "_TransferRequest__transfer_type": self.__transfer_type,
+            "_TransferRequest__concept": self.__concept,
+            "_TransferRequest__transfer_date": self.__transfer_date,
+            "_TransferRequest__transfer_amount": self.__transfer_amount,
+            "_TransferRequest__time_stamp": self.__time_stamp
+        })
 
     @property
     def from_iban(self):
@@ -30,6 +43,7 @@ class TransferRequest:
     @from_iban.setter
     def from_iban(self, value):
         self.__from_iban = value
+        self.__transfer_code = None
 
     @property
     def to_iban(self):
@@ -39,6 +53,7 @@ class TransferRequest:
     @to_iban.setter
     def to_iban(self, value):
         self.__to_iban = value
+        self.__transfer_code = None
 
     @property
     def transfer_concept(self):
@@ -48,6 +63,7 @@ class TransferRequest:
     @transfer_concept.setter
     def transfer_concept(self, value):
         self.__concept = value
+        self.__transfer_code = None
 
     @property
     def transfer_type(self):
@@ -57,6 +73,7 @@ class TransferRequest:
     @transfer_type.setter
     def transfer_type(self, value):
         self.__transfer_type = value
+        self.__transfer_code = None
 
     @property
     def transfer_date(self):
@@ -66,6 +83,7 @@ class TransferRequest:
     @transfer_date.setter
     def transfer_date(self, value):
         self.__transfer_date = value
+        self.__transfer_code = None
 
     @property
     def transfer_amount(self):
@@ -75,6 +93,7 @@ class TransferRequest:
     @transfer_amount.setter
     def transfer_amount(self, value):
         self.__transfer_amount = value
+        self.__transfer_code = None
 
     @property
     def time_stamp(self):
@@ -84,7 +103,9 @@ class TransferRequest:
     @property
     def transfer_code(self) -> str:
         """Returns the md5 signature (transfer code)"""
-        return hashlib.md5(str(self).encode()).hexdigest()
+        if self.__transfer_code is None:
+            self.__transfer_code = hashlib.md5(str(self).encode()).hexdigest()
+        return self.__transfer_code
 
     def to_json(self):
         """returns the object information in json format"""
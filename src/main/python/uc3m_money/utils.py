@@ -1,62 +1,163 @@
 """Common utility functions for file I/O and validation"""
 import os
 import re
+import stat
 import json
+from functools import lru_cache
 from uc3m_money.account_management_exception import AccountManagementException
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_STORE_OPEN_FLAGS = os.O_RDWR | getattr(os, "O_BINARY", 0)
+_IBAN_RE = re.compile(r"ES[0-9]{22}")
+# Last byte of any JSON value that can precede the closing bracket of a list
+_VALUE_END_BYTES = frozenset(b']}"0123456789el')
+# Stores this process last appended to, mapped to their signature after the write
+_verified_stores = {}
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize data as indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
 def load_json_or_empty(file_path: str) -> list:
     """Load JSON list from file or return empty list if missing."""
     try:
-        with open(file_path, "r", encoding="utf-8", newline="") as file:
-            return json.load(file)
+        with open(file_path, "rb") as file:
+            return _json_loads(file.read())
     except FileNotFoundError:
         return []
     except json.JSONDecodeError as ex:
         raise AccountManagementException("JSON Decode Error - Wrong JSON Format") from ex
 
 
+def file_signature(file_path: str):
+    """Return (inode, mtime_ns, size) of a file, or None if it is not a regular file."""
+    try:
+        status = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    if not stat.S_ISREG(status.st_mode):
+        return None
+    return status.st_ino, status.st_mtime_ns, status.st_size
+
+
 def write_json(file_path: str, data) -> None:
     """Write JSON data to file."""
     try:
-        with open(file_path, "w", encoding="utf-8", newline="") as file:
-            json.dump(data, file, indent=2)
+        with open(file_path, "wb") as file:
+            file.write(_json_dumps(data))
     except FileNotFoundError as ex:
         raise AccountManagementException("Wrong file or file path") from ex
 
 
+def _last_token(file_descriptor: int, end: int) -> tuple[int, bytes]:
+    """Return offset and value of the last non-whitespace byte before end."""
+    while end > 0:
+        start = max(end - 64, 0)
+        os.lseek(file_descriptor, start, os.SEEK_SET)
+        chunk = os.read(file_descriptor, end - start).rstrip()
+        if chunk:
+            return start + len(chunk) - 1, chunk[-1:]
+        end = start
+    return -1, b""
+
+
+def _fd_signature(file_descriptor: int) -> tuple[int, int, int]:
+    """Return (inode, mtime_ns, size) of an open file."""
+    status = os.fstat(file_descriptor)
+    return status.st_ino, status.st_mtime_ns, status.st_size
+
+
+def _check_store(file_descriptor: int) -> None:
+    """Raise unless the whole file parses as a JSON list."""
+    os.lseek(file_descriptor, 0, os.SEEK_SET)
+    chunks = []
+    chunk = os.read(file_descriptor, 65536)
+    while chunk:
+        chunks.append(chunk)
+        chunk = os.read(file_descriptor, 65536)
+    try:
+        data = _json_loads(b"".join(chunks))
+    except json.JSONDecodeError as ex:
+        raise AccountManagementException("JSON Decode Error - Wrong JSON Format") from ex
+    if not isinstance(data, list):
+        raise AccountManagementException("JSON Decode Error - Wrong JSON Format")
+
+
+def _splice_record(file_descriptor: int, record) -> None:
+    """Write record before the closing bracket of the JSON list in the file."""
+    closing_pos, closing = _last_token(file_descriptor,
+                                       os.lseek(file_descriptor, 0, os.SEEK_END))
+    previous_pos, previous = _last_token(file_descriptor, closing_pos)
+    os.lseek(file_descriptor, 0, os.SEEK_SET)
+    if (closing != b"]" or not previous or
+            (previous != b"[" and previous[0] not in _VALUE_END_BYTES) or
+            os.read(file_descriptor, 64).lstrip()[:1] != b"["):
+        raise AccountManagementException("JSON Decode Error - Wrong JSON Format")
+    item = _json_dumps(record).replace(b"\n", b"\n  ")
+    separator = b"\n  " if previous == b"[" else b",\n  "
+    payload = separator + item + b"\n]"
+    position = os.lseek(file_descriptor, previous_pos + 1, os.SEEK_SET)
+    while payload:
+        written = os.write(file_descriptor, payload)
+        position += written
+        payload = payload[written:]
+    os.ftruncate(file_descriptor, position)
+
+
 def append_record(file_path: str, record) -> None:
-    """Append a record to a JSON list in file."""
-    records = load_json_or_empty(file_path)
-    records.append(record)
-    write_json(file_path, records)
+    """Append a record to a JSON list in file, writing only the new record.
+
+    A store not last written by this process is fully parsed first, so a
+    corrupt file is rejected instead of being appended to.
+    """
+    try:
+        file_descriptor = os.open(file_path, _STORE_OPEN_FLAGS)
+    except FileNotFoundError:
+        write_json(file_path, [record])
+        return
+    try:
+        if _verified_stores.get(file_path) != _fd_signature(file_descriptor):
+            _check_store(file_descriptor)
+        _splice_record(file_descriptor, record)
+        _verified_stores[file_path] = _fd_signature(file_descriptor)
+    finally:
+        os.close(file_descriptor)
 
 
 def load_json_strict(file_path: str):
     """Load JSON from file, raising exceptions if file not found or invalid JSON."""
-    if not os.path.isfile(file_path):
-        raise AccountManagementException("Error: file input not found")
     try:
-        with open(file_path, "r", encoding="utf-8", newline="") as file:
-            return json.load(file)
+        with open(file_path, "rb") as file:
+            return _json_loads(file.read())
+    except (FileNotFoundError, IsADirectoryError) as ex:
+        raise AccountManagementException("Error: file input not found") from ex
     except json.JSONDecodeError as ex:
         raise AccountManagementException("JSON Decode Error - Wrong JSON Format") from ex
 
 
+@lru_cache(maxsize=4096)
 def validate_iban(iban_str: str) -> str:
     """Validates the control digit of a Spanish IBAN."""
-    iban_pattern = re.compile(r"^ES[0-9]{22}")
-    result_expression = iban_pattern.fullmatch(iban_str)
-    if not result_expression:
+    if not _IBAN_RE.fullmatch(iban_str):
         raise AccountManagementException("Invalid IBAN format")
-    iban = iban_str
-    original_code = iban[2:4]
-    iban = iban[:2] + "00" + iban[4:]
-    iban = iban[4:] + iban[:4]
-    for char, value in zip("ABCDEFGHIJKLMNOPQRSTUVWXYZ", range(10, 36)):
-        iban = iban.replace(char, str(value))
-    numeric_iban = int(iban)
-    remainder = numeric_iban % 97
+    # "ES" plus zeroed check digits, moved behind the BBAN, reads 142800 (E=14, S=28)
+    remainder = int(iban_str[4:] + "142800") % 97
     computed_dc = 98 - remainder
-    if int(original_code) != computed_dc:
+    if int(iban_str[2:4]) != computed_dc:
         raise AccountManagementException("Invalid IBAN control digit")
     return iban_str
\ No newline at end of file
@@ -230,6 +230,53 @@ class TestCalculateBalance(TestCase):
 
         self.assertEqual(hash_new, hash_original)
 
+    def test_transactions_file_replaced(self):
+        """path re-reading the transactions after the file is replaced"""
+        mngr = AccountManager()
+        self.assertTrue(mngr.calculate_balance(iban="ES3559005439021242088295"))
+        self.rename_file(TRANSACTIONS_STORE_FILE, NOMBRE_FICHERO_TEMPORAL)
+        self.rename_file(EMPTY_TRANSACTIONS_FILE, TRANSACTIONS_STORE_FILE)
+        try:
+            with self.assertRaises(AccountManagementException) as cm_obj:
+                mngr.calculate_balance(iban="ES3559005439021242088295")
+        finally:
+            self.rename_file(TRANSACTIONS_STORE_FILE, EMPTY_TRANSACTIONS_FILE)
+            self.rename_file(NOMBRE_FICHERO_TEMPORAL, TRANSACTIONS_STORE_FILE)
+            if os.path.exists(BALANCES_STORE_FILE):
+                remove(BALANCES_STORE_FILE)
+        self.assertEqual("IBAN not found", cm_obj.exception.message)
+
+    def test_transactions_with_malformed_iban(self):
+        """path skipping transactions whose IBAN is not a string"""
+        mngr = AccountManager()
+        self.rename_file(TRANSACTIONS_STORE_FILE, NOMBRE_FICHERO_TEMPORAL)
+        with open(TRANSACTIONS_STORE_FILE, "w", encoding="utf-8") as file:
+            json.dump([{"IBAN": ["ES3559005439021242088295"], "amount": "+1.00"},
+                       {"IBAN": {"code": "ES"}, "amount": "+2.00"},
+                       {"IBAN": "ES3559005439021242088295", "amount": "+10.00"}], file)
+        try:
+            self.assertTrue(mngr.calculate_balance(iban="ES3559005439021242088295"))
+            data = self.read_file()
+        finally:
+            remove(TRANSACTIONS_STORE_FILE)
+            self.rename_file(NOMBRE_FICHERO_TEMPORAL, TRANSACTIONS_STORE_FILE)
+            if os.path.exists(BALANCES_STORE_FILE):
+                remove(BALANCES_STORE_FILE)
+        self.assertEqual(10.0, data[-1]["BALANCE"])
+
+    def test_transactions_file_is_directory(self):
+        """path with a directory in place of the transactions file"""
+        mngr = AccountManager()
+        self.rename_file(TRANSACTIONS_STORE_FILE, NOMBRE_FICHERO_TEMPORAL)
+        os.mkdir(TRANSACTIONS_STORE_FILE)
+        try:
+            with self.assertRaises(AccountManagementException) as cm_obj:
+                mngr.calculate_balance(iban="ES3559005439021242088295")
+        finally:
+            os.rmdir(TRANSACTIONS_STORE_FILE)
+            self.rename_file(NOMBRE_FICHERO_TEMPORAL, TRANSACTIONS_STORE_FILE)
+        self.assertEqual("Wrong file  or file path", cm_obj.exception.message)
+
 
     def rename_file(self, old_name, new_name):
         """renames a file (if it exists)"""
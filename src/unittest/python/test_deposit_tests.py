@@ -81,3 +81,26 @@ class TestDepositIntoAccountTests(TestCase):
                         else:
                             hash_new = ""
                         self.assertEqual(hash_new, hash_original)
+
+    @freeze_time("2025/03/26 14:00:00")
+    def test_deposit_appended_to_store(self):
+        """a second deposit is appended keeping the previous one in the store"""
+        mngr = AccountManager()
+        first = mngr.deposit_into_account(JSON_FILES_DEPOSITS + "case_ok.json")
+        second = mngr.deposit_into_account(JSON_FILES_DEPOSITS + "case_ok.json")
+        my_data = self.read_file()
+        self.assertEqual([first, second], [k["deposit_signature"] for k in my_data])
+
+    def test_deposit_into_corrupt_store(self):
+        """a corrupt deposits store is rejected and left untouched"""
+        mngr = AccountManager()
+        for content in ("[1,]", "[1 2]", "[}]", "[\n  {\"a\": 1},\n]", "{}"):
+            with self.subTest(content=content):
+                with open(DEPOSITS_STORE_FILE, "w", encoding="utf-8") as file:
+                    file.write(content)
+                with self.assertRaises(AccountManagementException) as cm_obj:
+                    mngr.deposit_into_account(JSON_FILES_DEPOSITS + "case_ok.json")
+                self.assertEqual("JSON Decode Error - Wrong JSON Format",
+                                 cm_obj.exception.message)
+                with open(DEPOSITS_STORE_FILE, "r", encoding="utf-8") as file:
+                    self.assertEqual(content, file.read())
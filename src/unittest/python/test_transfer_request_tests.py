@@ -256,3 +256,57 @@ class TestTransferRequestTest(TestCase):
         else:
             hash_new = ""
         self.assertEqual(hash_new, hash_original)
+
+    @freeze_time("2025/03/22 13:00:00")
+    def test_transfer_after_store_removed(self):
+        """a stored transfer is no longer a duplicate once the store is removed"""
+        iban_from = "ES6211110783482828975098"
+        iban_to = "ES8658342044541216872704"
+        mngr = AccountManager()
+        first = mngr.transfer_request(from_iban=iban_from,
+                                      to_iban=iban_to,
+                                      transfer_type="ORDINARY",
+                                      amount=10.0,
+                                      date="22/03/2025",
+                                      concept="Testing removed store")
+        remove(TRANSFERS_STORE_FILE)
+        second = mngr.transfer_request(from_iban=iban_from,
+                                       to_iban=iban_to,
+                                       transfer_type="ORDINARY",
+                                       amount=10.0,
+                                       date="22/03/2025",
+                                       concept="Testing removed store")
+        self.assertEqual(first, second)
+        self.assertEqual(1, len(self.read_file()))
+
+    @freeze_time("2025/03/22 13:00:00")
+    def test_transfer_with_malformed_stored_transfers(self):
+        """malformed stored transfers are never taken for duplicates"""
+        details = {"from_iban": "ES6211110783482828975098",
+                   "to_iban": "ES8658342044541216872704",
+                   "transfer_type": "ORDINARY",
+                   "transfer_concept": "Testing malformed store",
+                   "transfer_date": "22/03/2025",
+                   "transfer_amount": 10.0}
+        stored = [{key: value for key, value in details.items() if key != "to_iban"},
+                  dict(details, transfer_concept=None),
+                  dict(details, transfer_amount="10.0"),
+                  dict(details, transfer_amount=[10.0])]
+        with open(TRANSFERS_STORE_FILE, "w", encoding="utf-8") as file:
+            json.dump(stored, file)
+        mngr = AccountManager()
+        mngr.transfer_request(from_iban=details["from_iban"],
+                              to_iban=details["to_iban"],
+                              transfer_type=details["transfer_type"],
+                              amount=details["transfer_amount"],
+                              date=details["transfer_date"],
+                              concept=details["transfer_concept"])
+        self.assertEqual(5, len(self.read_file()))
+        with self.assertRaises(AccountManagementException) as cm_obj:
+            mngr.transfer_request(from_iban=details["from_iban"],
+                                  to_iban=details["to_iban"],
+                                  transfer_type=details["transfer_type"],
+                                  amount=10,
+                                  date=details["transfer_date"],
+                                  concept=details["transfer_concept"])
+        self.assertEqual("Duplicated transfer in transfer list", cm_obj.exception.message)